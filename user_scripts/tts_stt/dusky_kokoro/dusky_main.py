@@ -3,18 +3,21 @@ import time
 import signal
 import threading
 import queue
+import collections
 import argparse
 import select
+import fcntl
 import gc
 import subprocess
-import soundfile as sf
 import re
-import hashlib
+import json
+import struct
 import numpy as np
 import traceback
 import shutil
 import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 
@@ -25,18 +28,27 @@ VERSION = "4.3 (Universal HW + Regression Fixes)"
 
 ZRAM_MOUNT = Path("/mnt/zram1")
 AUDIO_OUTPUT_DIR = ZRAM_MOUNT / "kokoro_audio"
+INDEX_FILE = ZRAM_MOUNT / ".kokoro_idx"
 FIFO_PATH = Path("/tmp/dusky_kokoro.fifo")
 PID_FILE = Path("/tmp/dusky_kokoro.pid")
 READY_FILE = Path("/tmp/dusky_kokoro.ready")
 
+# auto = fp16 on GPU / int8 on CPU when the converted file exists, else fp32
+MODEL_PRECISION = os.environ.get("DUSKY_MODEL_PRECISION", "auto").lower()
+
 DEFAULT_VOICE = "af_sarah"
 SPEED = 1.0
 SAMPLE_RATE = 24000
 
 MAX_BATCH_LEN = 2000
-IDLE_TIMEOUT = 10.0
+SYNTH_BATCH_LEN = 300
+SECONDS_PER_CHAR = 0.15  # generous speech-length estimate for buffer sizing
+# Seconds before the model is dropped from VRAM; unset/inf keeps it resident
+try: IDLE_TIMEOUT = float(os.environ.get("DUSKY_IDLE_TIMEOUT", "inf"))
+except ValueError: IDLE_TIMEOUT = float("inf")
 DEDUP_WINDOW = 2.0
 QUEUE_SIZE = 5
+MPV_PIPE_SIZE = 1 << 20  # default unprivileged max (/proc/sys/fs/pipe-max-size)
 
 # ==============================================================================
 # LOGGING
@@ -77,46 +89,139 @@ threading.excepthook = custom_excepthook
 # ==============================================================================
 RE_MARKDOWN_LINK = re.compile(r'\[([^\]]+)\]\([^)]+\)')
 RE_URL = re.compile(r'https?://\S+', re.IGNORECASE)
-RE_CLEAN = re.compile(r"[^a-zA-Z0-9\s.,!?;:'%\-]")
-RE_SENTENCE_SPLIT = re.compile(
-    r'(?<!\bMr)(?<!\bMrs)(?<!\bMs)(?<!\bDr)(?<!\bJr)(?<!\bSr)'
-    r'(?<!\bProf)(?<!\bVol)(?<!\bNo)(?<!\bVs)(?<!\bEtc)'
-    r'\s*([.?!;:]+)\s+'
+RE_SENTENCE_END = re.compile(r'\s*([.?!;:]+)\s+')
+ABBREVIATIONS = frozenset(
+    ("Mr", "Mrs", "Ms", "Dr", "Jr", "Sr", "Prof", "Vol", "No", "Vs", "Etc")
 )
+_ABBREV_LENS = sorted({len(a) for a in ABBREVIATIONS})
+# Cheap prefilter: a candidate can only follow an abbreviation ending in one of these
+_ABBREV_TAILS = frozenset(a[-1] for a in ABBREVIATIONS)
+
+_ALNUM = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+_CLEAN_KEEP = frozenset(_ALNUM + ".,!?;:'%-")
+_SLUG_KEEP = frozenset(_ALNUM)
+
+
+class _TranslateTable(dict):
+    """Memoized str.translate map: code points passing keep() map to themselves,
+    everything else to repl (a code point, or None to delete).
+
+    ASCII is prefilled; other code points cost a Python call only the first
+    time they are seen.
+    """
+    def __init__(self, keep, repl):
+        super().__init__()
+        self._keep = keep
+        self._repl = repl
+        self.update({cp: self._lookup(cp) for cp in range(128)})
+
+    def _lookup(self, cp):
+        return cp if self._keep(chr(cp)) else self._repl
+
+    def __missing__(self, cp):
+        repl = self[cp] = self._lookup(cp)
+        return repl
+
+
+# Same character class as r"[^a-zA-Z0-9\s.,!?;:'%\-]" -> space
+_CLEAN_TBL = _TranslateTable(lambda ch: ch in _CLEAN_KEEP or ch.isspace(), 0x20)
+# Slugs keep [a-zA-Z0-9] only
+_SLUG_TBL = _TranslateTable(_SLUG_KEEP.__contains__, None)
 
 
 def clean_text(text):
     text = RE_MARKDOWN_LINK.sub(r'\1', text)
     text = RE_URL.sub('Link', text)
-    text = RE_CLEAN.sub(' ', text)
+    text = text.translate(_CLEAN_TBL)
     return ' '.join(text.split())
 
 
+def _follows_abbrev(text, pos):
+    """True if text[:pos] ends with a whole-word entry from ABBREVIATIONS."""
+    if pos == 0 or text[pos - 1] not in _ABBREV_TAILS: return False
+    for n in _ABBREV_LENS:
+        start = pos - n
+        if start < 0: break
+        if text[start:pos] in ABBREVIATIONS:
+            if start == 0: return True
+            prev = text[start - 1]
+            if not (prev.isalnum() or prev == '_'): return True
+    return False
+
+
 def smart_split(text):
     if not text:
         return []
-    chunks = RE_SENTENCE_SPLIT.split(text)
-    if len(chunks) == 1:
-        return [text.strip()] if text.strip() else []
     sentences = []
-    for i in range(0, len(chunks) - 1, 2):
-        sentence = chunks[i].strip()
-        punctuation = chunks[i + 1].strip() if i + 1 < len(chunks) else ''
+    start = pos = 0
+    while True:
+        m = RE_SENTENCE_END.search(text, pos)
+        if m is None: break
+        if _follows_abbrev(text, m.start()):
+            # Same as a failed lookbehind: retry one character further on
+            pos = m.start() + 1
+            continue
+        sentence = text[start:m.start()].strip()
         if sentence:
-            sentences.append(f"{sentence}{punctuation}")
-    if len(chunks) % 2 != 0:
-        trailing = chunks[-1].strip()
-        if trailing:
-            sentences.append(trailing)
+            sentences.append(f"{sentence}{m.group(1)}")
+        start = pos = m.end()
+    trailing = text[start:].strip()
+    if trailing:
+        sentences.append(trailing)
     return sentences
 
 
+def batch_sentences(sentences, max_len=SYNTH_BATCH_LEN):
+    """Merge consecutive sentences into chunks of up to max_len chars.
+
+    Each chunk is one model.create() call, so short sentences share a single
+    inference instead of paying per-call overhead. The first sentence is
+    always emitted alone to keep time-to-first-audio low.
+    """
+    if not sentences:
+        return []
+    batches = [sentences[0]]
+    current = []
+    current_len = 0
+    for sentence in sentences[1:]:
+        if current and current_len + 1 + len(sentence) > max_len:
+            batches.append(" ".join(current))
+            current = []
+            current_len = 0
+        current_len += len(sentence) + (1 if current else 0)
+        current.append(sentence)
+    if current:
+        batches.append(" ".join(current))
+    return batches
+
+
+def parse_fifo_message(text):
+    """Split a FIFO message into (text, save).
+
+    Plain text is spoken and saved. A JSON envelope such as
+    {"text": "...", "save": false} streams the audio without writing a WAV.
+    """
+    if text.startswith('{'):
+        try: msg = json.loads(text)
+        except ValueError: msg = None
+        if isinstance(msg, dict) and isinstance(msg.get("text"), str):
+            # Only a JSON false disables saving; "false", 0, null etc. keep the default
+            return msg["text"], msg.get("save", True) is not False
+    return text, True
+
+
 def generate_filename_slug(text):
-    clean = re.sub(r'[^a-zA-Z0-9\s]', '', text)
-    words = clean.split()
+    # Deleted chars are never whitespace, so filtering word by word is
+    # equivalent to filtering the whole text, and we can stop at five words.
+    words = []
+    for word in text.split():
+        word = word.translate(_SLUG_TBL)
+        if word:
+            words.append(word)
+            if len(words) == 5: break
     if not words:
         return "audio"
-    return "_".join(words[:5]).lower()
+    return "_".join(words).lower()
 
 
 def get_next_index(directory):
@@ -135,6 +240,28 @@ def get_next_index(directory):
     return max_idx + 1
 
 
+# ==============================================================================
+# AUDIO I/O
+# ==============================================================================
+WAVE_FORMAT_IEEE_FLOAT = 3
+
+
+def _write_wav_fast(path, samples, sr):
+    """Write mono float32 samples as an IEEE-float WAV: fixed header + raw payload."""
+    samples = np.ascontiguousarray(samples, dtype='<f4')
+    data_size = samples.nbytes
+    header = struct.pack(
+        '<4sI4s4sIHHIIHHH4sII4sI',
+        b'RIFF', 4 + 26 + 12 + 8 + data_size, b'WAVE',
+        b'fmt ', 18, WAVE_FORMAT_IEEE_FLOAT, 1, sr, sr * 4, 4, 32, 0,
+        b'fact', 4, len(samples),
+        b'data', data_size,
+    )
+    with open(path, 'wb') as f:
+        f.write(header)
+        samples.tofile(f)
+
+
 # ==============================================================================
 # HARDWARE ENFORCER (UNIVERSAL - FIXED ROCM)
 # ==============================================================================
@@ -144,8 +271,18 @@ _available = rt.get_available_providers()
 logger.info(f"ONNX Runtime initialized. Detected Providers: {_available}")
 
 
+# Model file contents kept in RAM when idle unloading is on, so a reload skips disk I/O
+_model_bytes = {}
+
+
 class PatchedInferenceSession(rt.InferenceSession):
     def __init__(self, path_or_bytes, sess_options=None, providers=None, **kwargs):
+        if IDLE_TIMEOUT != float("inf") and isinstance(path_or_bytes, (str, os.PathLike)):
+            key = os.fspath(path_or_bytes)
+            if key not in _model_bytes:
+                with open(key, 'rb') as f: _model_bytes[key] = f.read()
+            path_or_bytes = _model_bytes[key]
+
         if sess_options is None:
             sess_options = rt.SessionOptions()
         
@@ -160,7 +297,7 @@ class PatchedInferenceSession(rt.InferenceSession):
             is_gpu = True
             cuda_options = {
                 'device_id': 0,
-                'arena_extend_strategy': 'kSameAsRequested',
+                'arena_extend_strategy': 'kNextPowerOfTwo',
                 'gpu_mem_limit': 3 * 1024 * 1024 * 1024, # 3GB VRAM limit
                 'cudnn_conv_algo_search': 'HEURISTIC',
                 'do_copy_in_default_stream': True,
@@ -175,7 +312,7 @@ class PatchedInferenceSession(rt.InferenceSession):
             is_gpu = True
             rocm_options = {
                 'device_id': 0,
-                'arena_extend_strategy': 'kSameAsRequested',
+                'arena_extend_strategy': 'kNextPowerOfTwo',
                 'gpu_mem_limit': 3 * 1024 * 1024 * 1024, # 3GB VRAM limit
                 'do_copy_in_default_stream': True,
             }
@@ -207,6 +344,62 @@ rt.InferenceSession = PatchedInferenceSession
 from kokoro_onnx import Kokoro
 
 
+def resolve_model_path(model_dir):
+    """Pick the kokoro model file for MODEL_PRECISION, falling back to FP32."""
+    fp32 = model_dir / "kokoro-v0_19.onnx"
+    precision = MODEL_PRECISION
+    if precision == "auto":
+        has_gpu = bool({'CUDAExecutionProvider', 'ROCmExecutionProvider'} & set(_available))
+        precision = "fp16" if has_gpu else "int8"
+    if precision == "fp32": return fp32
+    variant = model_dir / f"kokoro-v0_19.{precision}.onnx"
+    if variant.exists(): return variant
+    if MODEL_PRECISION != "auto":
+        logger.warning(f"{variant.name} not found. Using FP32 model.")
+    return fp32
+
+
+# ==============================================================================
+# AUDIO HAND-OFF (SINGLE PRODUCER / SINGLE CONSUMER)
+# ==============================================================================
+class AudioChannel:
+    """Bounded deque + two Events in place of queue.Queue for the audio path.
+
+    deque append/popleft are atomic under the GIL, so with one producer
+    (generate) and one consumer (MPV-Thread) the Events are only touched on
+    empty/full transitions. put/get/get_nowait keep queue.Queue semantics,
+    including blocking on full and raising queue.Full / queue.Empty.
+    """
+    def __init__(self, maxsize):
+        self._items = collections.deque()
+        self._maxsize = maxsize
+        self._ready = threading.Event()
+        self._space = threading.Event()
+        self._space.set()
+
+    def put(self, item, timeout=None):
+        if len(self._items) >= self._maxsize:
+            self._space.clear()
+            # Re-check after clear so a concurrent get() cannot be missed
+            if len(self._items) >= self._maxsize and not self._space.wait(timeout):
+                raise queue.Full
+        self._items.append(item)
+        if not self._ready.is_set(): self._ready.set()
+
+    def get(self, timeout=None):
+        if not self._items:
+            self._ready.clear()
+            if not self._items and not self._ready.wait(timeout):
+                raise queue.Empty
+        return self.get_nowait()
+
+    def get_nowait(self):
+        try: item = self._items.popleft()
+        except IndexError: raise queue.Empty
+        if not self._space.is_set(): self._space.set()
+        return item
+
+
 # ==============================================================================
 # THREAD 1: MPV STREAMER (STREAM ID ARCHITECTURE)
 # ==============================================================================
@@ -218,8 +411,10 @@ class AudioPlaybackThread(threading.Thread):
         self.active = True
         self.daemon = True
         self._mpv_process = None
+        self._mpv_alive = False  # cleared by on_sigchld(); avoids waitpid() per tick
         self._lock = threading.Lock()
         self._current_stream_id = None
+        self._carry = []  # item pulled while batching that belongs to the next iteration
 
         if not shutil.which("mpv"):
             logger.critical("MPV executable not found in PATH!")
@@ -260,6 +455,11 @@ class AudioPlaybackThread(threading.Thread):
                 cmd, stdin=subprocess.PIPE, stderr=sys.stderr, stdout=subprocess.DEVNULL,
                 env=mpv_env, start_new_session=False, close_fds=True
             )
+            # Non-blocking stdin: _timed_write handles partial writes itself
+            os.set_blocking(proc.stdin.fileno(), False)
+            # Bigger pipe: a typical chunk fits in one write, fewer select() round trips
+            try: fcntl.fcntl(proc.stdin.fileno(), fcntl.F_SETPIPE_SZ, MPV_PIPE_SIZE)
+            except (AttributeError, OSError) as e: logger.debug(f"Cannot resize MPV pipe: {e}")
             logger.info(f"MPV started (PID: {proc.pid})")
             return proc
         except Exception as e:
@@ -269,7 +469,7 @@ class AudioPlaybackThread(threading.Thread):
     def _prepare_mpv_for_chunk(self, chunk_stream_id):
         with self._lock:
             proc = self._mpv_process
-            is_alive = (proc is not None and proc.poll() is None)
+            is_alive = (proc is not None and self._mpv_alive)
 
             if chunk_stream_id == self._current_stream_id:
                 if is_alive: return proc
@@ -286,9 +486,22 @@ class AudioPlaybackThread(threading.Thread):
             logger.info(f"Starting new stream ({chunk_stream_id[:8]}...). Spawning MPV.")
             new_proc = self._spawn_mpv()
             self._mpv_process = new_proc
+            self._mpv_alive = new_proc is not None
             self._current_stream_id = chunk_stream_id
+            # A SIGCHLD delivered before the handle was published was missed
+            self.on_sigchld()
             return new_proc
 
+    def on_sigchld(self):
+        """SIGCHLD hook (main thread): flag the current MPV as dead without reaping it."""
+        proc = self._mpv_process
+        if proc is None: return
+        try:
+            info = os.waitid(os.P_PID, proc.pid, os.WEXITED | os.WNOHANG | os.WNOWAIT)
+        except ChildProcessError: info = True
+        # Ignore the exit of a process that has since been replaced
+        if info is not None and self._mpv_process is proc: self._mpv_alive = False
+
     def _finish_stream(self):
         with self._lock:
             self._current_stream_id = None
@@ -309,52 +522,80 @@ class AudioPlaybackThread(threading.Thread):
             self._kill_process(proc)
         except Exception: pass
 
-    def _timed_write(self, proc, data, timeout=2.0):
+    def _timed_write(self, proc, chunks, timeout=2.0):
+        """Write a list of buffers to MPV's stdin fd; several chunks go out in one writev()."""
         try: fd = proc.stdin.fileno()
         except Exception: return False
-        try: _, wlist, _ = select.select([], [fd], [], timeout)
-        except (ValueError, OSError): return False
-        if not wlist:
-            logger.error("MPV write timed out (Hung?). Killing.")
-            self._kill_process(proc)
-            return False
-        try:
-            proc.stdin.write(data)
-            proc.stdin.flush()
-            return True
-        except (BrokenPipeError, OSError): return False
+        views = [v for v in (memoryview(c).cast('B') for c in chunks) if v]
+        while views:
+            try: _, wlist, _ = select.select([], [fd], [], timeout)
+            except (ValueError, OSError): return False
+            if not wlist:
+                logger.error("MPV write timed out (Hung?). Killing.")
+                self._kill_process(proc)
+                return False
+            try:
+                if len(views) == 1: written = os.write(fd, views[0])
+                else: written = os.writev(fd, views)
+            except BlockingIOError: continue
+            except (BrokenPipeError, OSError): return False
+            # Advance past whatever the kernel accepted (short writes are normal)
+            while written:
+                if written >= len(views[0]): written -= len(views.pop(0))
+                else:
+                    views[0] = views[0][written:]
+                    written = 0
+        return True
+
+    @staticmethod
+    def _as_bytes(samples):
+        samples = np.ascontiguousarray(samples.astype(np.float32, copy=False))
+        return memoryview(samples).cast('B')
+
+    def _next_item(self, timeout):
+        if self._carry: return self._carry.pop()
+        return self.audio_queue.get(timeout=timeout)
+
+    def _collect_stream_chunks(self, stream_id):
+        """Pull already-queued chunks of the same stream so they share one write."""
+        chunks = []
+        while len(chunks) < QUEUE_SIZE:
+            try: item = self.audio_queue.get_nowait()
+            except queue.Empty: break
+            if item is None or item[2] != stream_id:
+                self._carry.append(item)
+                break
+            chunks.append(self._as_bytes(item[0]))
+        return chunks
 
     def run(self):
         try:
             while self.active:
-                try: item = self.audio_queue.get(timeout=0.2)
+                try: item = self._next_item(timeout=0.2)
                 except queue.Empty:
-                    with self._lock:
-                        if self._mpv_process and self._mpv_process.poll() is not None:
-                            logger.debug("Cleaning up dead MPV handle (Idle).")
-                            self._mpv_process = None
+                    if not self._mpv_alive and self._mpv_process is not None:
+                        logger.debug("Cleaning up dead MPV handle (Idle).")
+                        with self._lock:
+                            dead_proc, self._mpv_process = self._mpv_process, None
+                        if dead_proc: dead_proc.poll()
                     continue
 
                 if item is None:
                     self._finish_stream()
-                    self.audio_queue.task_done()
                     continue
 
-                if self.stop_event.is_set():
-                    self.audio_queue.task_done()
-                    continue
+                if self.stop_event.is_set(): continue
 
                 samples, _, stream_id = item
-                if samples.dtype != np.float32: samples = samples.astype(np.float32)
-                raw_bytes = samples.tobytes()
+                chunks = [self._as_bytes(samples)]
+                chunks.extend(self._collect_stream_chunks(stream_id))
 
                 try:
                     proc = self._prepare_mpv_for_chunk(stream_id)
                     if not proc:
-                        self.audio_queue.task_done()
                         self._drain_queue()
                         continue
-                    if not self._timed_write(proc, raw_bytes): raise BrokenPipeError("Write failed")
+                    if not self._timed_write(proc, chunks): raise BrokenPipeError("Write failed")
                 except (BrokenPipeError, OSError):
                     logger.warning("MPV Connection Broken. Stopping.")
                     with self._lock:
@@ -363,18 +604,15 @@ class AudioPlaybackThread(threading.Thread):
                         self._current_stream_id = None
                     self._kill_process(dead_proc)
                     self.stop_event.set()
-                    self.audio_queue.task_done()
                     self._drain_queue()
                     continue
                 except Exception as e: logger.error(f"Playback Error: {e}")
-                self.audio_queue.task_done()
         finally: self.cleanup()
 
     def _drain_queue(self):
+        self._carry.clear()
         while True:
-            try:
-                self.audio_queue.get_nowait()
-                self.audio_queue.task_done()
+            try: self.audio_queue.get_nowait()
             except queue.Empty: break
 
     def cleanup(self):
@@ -399,6 +637,31 @@ class FifoReader(threading.Thread):
         self.last_hash = None
         self.last_time = 0
         self.fd = None 
+        # Self-pipe so stop() can wake the blocking poll() immediately
+        self._wake_r, self._wake_w = os.pipe()
+        # Reused read buffers: one readv() fills up to 8 x 64KB
+        self._bufs = [bytearray(65536) for _ in range(8)]
+        self._capacity = sum(len(b) for b in self._bufs)
+
+    def stop(self):
+        self.active = False
+        try: os.write(self._wake_w, b'\0')
+        except OSError: pass
+
+    def _read_available(self, fd):
+        data = bytearray()
+        while True:
+            try: n = os.readv(fd, self._bufs)
+            except BlockingIOError: break
+            if not n: break
+            remaining = n
+            for buf in self._bufs:
+                take = min(remaining, len(buf))
+                data += memoryview(buf)[:take]
+                remaining -= take
+                if not remaining: break
+            if n < self._capacity: break
+        return data
 
     def run(self):
         if self.fd is not None: fd = self.fd
@@ -408,30 +671,30 @@ class FifoReader(threading.Thread):
 
         poll = select.poll()
         poll.register(fd, select.POLLIN)
+        poll.register(self._wake_r, select.POLLIN)
 
         while self.active:
-            if not poll.poll(500): continue
+            events = poll.poll()
+            if not self.active: break
+            if not any(f == fd for f, _ in events): continue
             try:
-                data = b""
-                while True:
-                    try:
-                        chunk = os.read(fd, 65536)
-                        if not chunk: break
-                        data += chunk
-                    except BlockingIOError: break
+                data = self._read_available(fd)
                 if not data: continue
                 text = data.decode('utf-8', errors='ignore').strip()
                 if not text: continue
-                h = hashlib.md5(text.encode()).hexdigest()
+                request = parse_fifo_message(text)
+                h = hash(request)
                 now = time.time()
                 if self.last_hash == h and (now - self.last_time) < DEDUP_WINDOW:
                     logger.info("Skipping duplicate.")
                     continue
                 self.last_hash = h
                 self.last_time = now
-                self.text_queue.put(text)
+                self.text_queue.put(request)
             except OSError: time.sleep(1)
         os.close(fd)
+        os.close(self._wake_r)
+        os.close(self._wake_w)
 
 
 # ==============================================================================
@@ -442,24 +705,67 @@ class DuskyDaemon:
         self.running = True
         if debug_file: setup_debug_logging(debug_file)
         logger.info(f"Dusky Daemon {VERSION} Initializing...")
-        self.audio_queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self.audio_queue = AudioChannel(QUEUE_SIZE)
         self.text_queue = queue.Queue()
         self.stop_event = threading.Event()
         self.playback = AudioPlaybackThread(self.audio_queue, self.stop_event)
         self.fifo_reader = FifoReader(self.text_queue, FIFO_PATH)
         env_dir = Path(__file__).parent
         self.kokoro = None
-        self.model_path = str(env_dir / "models/kokoro-v0_19.onnx")
+        self.fp32_model_path = str(env_dir / "models/kokoro-v0_19.onnx")
+        self.model_path = str(resolve_model_path(env_dir / "models"))
         self.voices_path = str(env_dir / "models/voices.bin")
         self.last_used = 0
+        self._last_idx = self._load_last_index()
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="WAV-Writer")
+
+    def _load_last_index(self):
+        """Last used WAV index: persisted counter if present, else a one-time directory scan."""
+        try: return int(INDEX_FILE.read_text().strip())
+        except (OSError, ValueError): pass
+        return get_next_index(AUDIO_OUTPUT_DIR) - 1
+
+    def _bump_index(self):
+        self._last_idx += 1
+        try: INDEX_FILE.write_text(str(self._last_idx))
+        except OSError as e: logger.debug(f"Cannot persist index: {e}")
+        return self._last_idx
 
     def get_model(self):
         self.last_used = time.time()
         if self.kokoro is None:
-            logger.info("Loading Kokoro...")
-            self.kokoro = Kokoro(self.model_path, self.voices_path)
+            logger.info(f"Loading Kokoro ({Path(self.model_path).name})...")
+            try: self.kokoro = Kokoro(self.model_path, self.voices_path)
+            except Exception as e:
+                if self.model_path == self.fp32_model_path: raise
+                logger.warning(f"Failed to load {Path(self.model_path).name}: {e}. Falling back to FP32.")
+                self.model_path = self.fp32_model_path
+                self.kokoro = Kokoro(self.model_path, self.voices_path)
         return self.kokoro
 
+    def _preload(self):
+        """Load and warm the model once at startup so the first request does not pay for it."""
+        try:
+            if not self._warmup(self.get_model()) and self.model_path != self.fp32_model_path:
+                # Variant loads but cannot infer: switch for good so later reloads don't retry it
+                logger.warning(f"{Path(self.model_path).name} failed warm-up. Falling back to FP32.")
+                self.model_path = self.fp32_model_path
+                self.kokoro = None
+                gc.collect()
+                self._warmup(self.get_model())
+        except Exception as e: logger.error(f"Model preload failed: {e}")
+
+    def _warmup(self, model):
+        """Dummy inference so arena growth and kernel selection happen before real text."""
+        t0 = time.time()
+        try:
+            model.create("Ready.", voice=DEFAULT_VOICE, speed=SPEED, lang="en-us")
+            logger.info(f"Model warm-up done in {time.time() - t0:.2f}s")
+            return True
+        except Exception as e:
+            logger.warning(f"Model warm-up failed: {e}")
+            return False
+
     def check_idle(self):
         if self.kokoro and (time.time() - self.last_used > IDLE_TIMEOUT):
             logger.info("Idle timeout. Cleaning VRAM.")
@@ -480,7 +786,25 @@ class DuskyDaemon:
         self.fifo_reader.fd = fd
         logger.debug("FIFO created and opened.")
 
-    def generate(self, text):
+    @staticmethod
+    def _save_wav(wav_path, samples, sr):
+        try:
+            _write_wav_fast(wav_path, samples, sr)
+            logger.info(f"Saved: {wav_path.name}")
+        except Exception as e: logger.error(f"Failed to save WAV: {e}")
+
+    @staticmethod
+    def _append_audio(buf, filled, audio):
+        """Copy audio into buf at filled, growing buf if the estimate was short."""
+        end = filled + len(audio)
+        if end > len(buf):
+            grown = np.empty(max(end, 2 * len(buf)), dtype=np.float32)
+            grown[:filled] = buf[:filled]
+            buf = grown
+        buf[filled:end] = audio
+        return buf, end
+
+    def generate(self, text, save=True):
         try:
             model = self.get_model()
             slug = generate_filename_slug(text)
@@ -489,34 +813,39 @@ class DuskyDaemon:
             logger.info(f"Generating: '{slug}' ({len(sentences)} sentences)")
             current_stream_id = str(uuid.uuid4())
 
-            try: AUDIO_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-            except OSError as e: logger.warning(f"Cannot create audio output dir: {e}")
-            idx = get_next_index(AUDIO_OUTPUT_DIR)
-            all_audio = []
+            if save:
+                try: AUDIO_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+                except OSError as e: logger.warning(f"Cannot create audio output dir: {e}")
+                # Initial estimate capped at MAX_BATCH_LEN chars; _append_audio grows past it
+                est_chars = min(len(text), MAX_BATCH_LEN)
+                combined = np.empty(int(est_chars * SECONDS_PER_CHAR * SAMPLE_RATE), dtype=np.float32)
+            filled = 0
+            produced = False
             final_sr = SAMPLE_RATE
 
-            for i, sentence in enumerate(sentences):
+            batches = batch_sentences(sentences)
+            for i, batch in enumerate(batches):
                 if self._should_stop(): break
-                logger.debug(f"  Sentence {i+1}/{len(sentences)}: {sentence[:60]}...")
-                audio, sr = model.create(sentence, voice=DEFAULT_VOICE, speed=SPEED, lang="en-us")
+                logger.debug(f"  Batch {i+1}/{len(batches)}: {batch[:60]}...")
+                audio, sr = model.create(batch, voice=DEFAULT_VOICE, speed=SPEED, lang="en-us")
                 if audio is None: continue
                 final_sr = sr
-                all_audio.append(audio)
+                produced = True
+                if save: combined, filled = self._append_audio(combined, filled, audio)
                 while not self._should_stop():
                     try:
                         self.audio_queue.put((audio, sr, current_stream_id), timeout=0.2)
                         break
                     except queue.Full: continue
 
-            if all_audio:
+            if produced:
                 try: self.audio_queue.put(None, timeout=5.0)
                 except queue.Full: logger.warning("Could not send end-of-stream sentinel.")
-                try:
-                    combined = np.concatenate(all_audio)
-                    wav_path = AUDIO_OUTPUT_DIR / f"{idx}_{slug}.wav"
-                    sf.write(str(wav_path), combined, final_sr)
-                    logger.info(f"Saved: {wav_path.name}")
-                except Exception as e: logger.error(f"Failed to save WAV: {e}")
+            if filled:
+                idx = self._bump_index()
+                wav_path = AUDIO_OUTPUT_DIR / f"{idx}_{slug}.wav"
+                # combined is private to this call, so the writer can own it
+                self._save_executor.submit(self._save_wav, wav_path, combined[:filled], final_sr)
         except Exception as e:
             logger.error(f"Generation Error: {e}")
             self.kokoro = None
@@ -524,19 +853,22 @@ class DuskyDaemon:
     def start(self):
         signal.signal(signal.SIGTERM, lambda s, f: self.stop())
         signal.signal(signal.SIGINT, lambda s, f: self.stop())
+        signal.signal(signal.SIGCHLD, lambda s, f: self.playback.on_sigchld())
         PID_FILE.write_text(str(os.getpid()))
         self._setup_fifo()
         self.playback.start()
         self.fifo_reader.start()
         READY_FILE.touch()
         logger.info(f"Daemon Ready (PID: {os.getpid()})")
+        # FIFO is already open, so text sent while this runs is simply queued
+        self._preload()
         try:
             while self.running:
                 try:
-                    text = self.text_queue.get(timeout=0.5)
+                    text, save = self.text_queue.get(timeout=0.5)
                     self.stop_event.clear()
                     clean = clean_text(text)
-                    if clean: self.generate(clean)
+                    if clean: self.generate(clean, save=save)
                     if self.stop_event.is_set():
                         logger.info("User interrupted playback. Flushing...")
                         drained = 0
@@ -566,8 +898,9 @@ class DuskyDaemon:
         logger.info("Shutting down...")
         self.running = False
         self.stop_event.set()
-        self.fifo_reader.active = False
+        self.fifo_reader.stop()
         self.playback.cleanup()
+        self._save_executor.shutdown(wait=True)
         for p in (FIFO_PATH, PID_FILE, READY_FILE):
             try: p.unlink(missing_ok=True)
             except Exception: pass
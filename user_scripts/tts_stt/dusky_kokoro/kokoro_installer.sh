@@ -90,7 +90,7 @@ uv init --python 3.12 --no-workspace 2>/dev/null || true
 echo ":: Installing Dependencies for $MODE..."
 
 # Common base deps
-uv add "soundfile" "numpy"
+uv add "numpy"
 
 case "$MODE" in
     nvidia)
@@ -127,6 +127,38 @@ if [[ ! -f "$MODEL_DIR/voices.bin" ]]; then
     curl -L "$VOICES_URL" -o "$MODEL_DIR/voices.bin"
 fi
 
+# --- 5b. Reduced-Precision Model (optional, one-time) ---
+# GPU: FP16 weights (half the VRAM, tensor-core math). CPU: dynamic INT8 weights.
+# dusky_main.py picks these up automatically and falls back to FP32 if absent.
+# Build tools are pulled ephemerally with --with, so the project deps stay unchanged.
+if [[ "$MODE" == "cpu" ]]; then
+    QUANT_MODEL="$MODEL_DIR/kokoro-v0_19.int8.onnx"
+    if [[ ! -f "$QUANT_MODEL" ]]; then
+        echo ":: Building INT8 model..."
+        if ! uv run --with onnx python -c "
+from onnxruntime.quantization import quantize_dynamic, QuantType
+quantize_dynamic('$MODEL_DIR/kokoro-v0_19.onnx', '$QUANT_MODEL', weight_type=QuantType.QInt8)
+"; then
+            echo ":: WARNING: INT8 conversion failed. Using FP32 model."
+            rm -f "$QUANT_MODEL"
+        fi
+    fi
+else
+    QUANT_MODEL="$MODEL_DIR/kokoro-v0_19.fp16.onnx"
+    if [[ ! -f "$QUANT_MODEL" ]]; then
+        echo ":: Building FP16 model..."
+        if ! uv run --with onnx --with onnxconverter-common python -c "
+import onnx
+from onnxconverter_common import float16
+model = float16.convert_float_to_float16(onnx.load('$MODEL_DIR/kokoro-v0_19.onnx'), keep_io_types=True)
+onnx.save(model, '$QUANT_MODEL')
+"; then
+            echo ":: WARNING: FP16 conversion failed. Using FP32 model."
+            rm -f "$QUANT_MODEL"
+        fi
+    fi
+fi
+
 # --- 6. Generate Trigger ---
 echo ":: Generating Trigger Script..."
 